@@ -38,8 +38,11 @@ class Settings:
         self.jwt_secret_key: str = self._get_env_var(
             "JWT_SECRET_KEY")
 
-        # CORS
-        self.cors_origin: str = self._get_env_var("CORS_ORIGIN")
+        # CORS (comma-separated list of allowed origins)
+        self.cors_origin: list[str] = [
+            origin.strip() for origin in self._get_env_var("CORS_ORIGIN").split(",")
+            if origin.strip()
+        ]
 
         # Risk Worker URL
         self.risk_worker_url: str = self._get_env_var("RISK_WORKER_URL")
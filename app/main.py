@@ -42,7 +42,7 @@ async def lifespan(_app: FastAPI):
 
     print("Shutting down...")
 
-app = FastAPI(
+fastapi_app = FastAPI(
     lifespan=lifespan,
     title="Risk API",
     description="A comprehensive risk management API",
@@ -50,30 +50,32 @@ app = FastAPI(
 )
 
 # Mount static files
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
+fastapi_app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
-app.add_middleware(
+fastapi_app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origin,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # allow_headers=["*"] made Starlette echo the requested headers on every
+    # preflight; explicit lists keep the preflight response headers static
+    allow_methods=["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"],
+    allow_headers=["authorization", "content-type"],
 )
 
 
-@app.get("/")
+@fastapi_app.get("/")
 def root():
     """ Root endpoint. """
     return {"message": "Welcome to the Risk API"}
 
 
-@app.head("/", include_in_schema=False)
+@fastapi_app.head("/", include_in_schema=False)
 def root_head():
     """ HEAD request handler for root endpoint (e.g. for health checks). """
     return Response(status_code=200)
 
 
-@app.get("/favicon.ico")
+@fastapi_app.get("/favicon.ico")
 def favicon():
     """ Favicon endpoint to serve the favicon.ico file. """
     return FileResponse(
@@ -83,12 +85,38 @@ def favicon():
     )
 
 
-@app.get("/healthz")
+@fastapi_app.get("/healthz")
 def healthz():
-    """ Health check endpoint. """
+    """ Health check endpoint (GET/HEAD are answered by HealthzASGI). """
     return {"status": "ok"}
 
 
-app.include_router(risk_router)
-app.include_router(user_router)
-app.include_router(portfolio_router)
+class HealthzASGI:
+    """ Pure ASGI wrapper answering health probes before the middleware stack. """
+
+    BODY = b'{"status":"ok"}'
+    HEADERS = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(BODY)).encode()),
+    ]
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/healthz" \
+                and scope["method"] in ("GET", "HEAD"):
+            await send({"type": "http.response.start", "status": 200, "headers": self.HEADERS})
+            body = b"" if scope["method"] == "HEAD" else self.BODY
+            await send({"type": "http.response.body", "body": body})
+            return
+        await self.app(scope, receive, send)
+
+
+fastapi_app.include_router(risk_router)
+fastapi_app.include_router(user_router)
+fastapi_app.include_router(portfolio_router)
+
+# Health checks short-circuit here and never reach the router or middleware;
+# fastapi_app stays importable for dependency_overrides and app.state
+app = HealthzASGI(fastapi_app)
@@ -1,5 +1,6 @@
 """ Database models for the application. """
 from typing import Optional, List
+from sqlalchemy import UniqueConstraint
 from sqlmodel import Field, SQLModel, Relationship
 
 
@@ -13,8 +14,11 @@ class User(SQLModel, table=True):
 
 class AssetPosition(SQLModel, table=True):
     """ Asset position model for the database. """
+    __table_args__ = (UniqueConstraint(
+        "user_id", "ticker", name="uq_user_ticker"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     ticker: str
     quantity: float
-    user_id: int = Field(foreign_key="user.id")
+    user_id: int = Field(foreign_key="user.id", index=True)
     owner: Optional["User"] = Relationship(back_populates="positions")
@@ -1,8 +1,9 @@
 """Redis service for Pub/Sub functionality."""
 import json
 import asyncio
-from typing import Optional, Any
+from typing import List, Optional, Any
 import fakeredis.aioredis
+import orjson
 import redis.asyncio as redis
 from app.config import settings
 from app.logger_service import logger
@@ -11,6 +12,12 @@ from app.logger_service import logger
 TICKER_UPDATES_CHANNEL = "ticker_updates"
 TICKER_PRICE_UPDATES_CHANNEL = "ticker_price_updates"
 
+# Cache payload encoding (numpy scalars/arrays and datetimes handled natively)
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+# Upper bound on pooled connections shared by all requests
+REDIS_MAX_CONNECTIONS = 50
+
 
 class RedisService:
     """Redis service for handling Pub/Sub operations."""
@@ -18,6 +25,7 @@ class RedisService:
     def __init__(self):
         self.redis_client: Optional[redis.Redis |
                                     fakeredis.aioredis.FakeRedis] = None
+        self.connection_pool: Optional[redis.ConnectionPool] = None
         self.is_fake_redis = False
 
     async def connect(self):
@@ -41,9 +49,7 @@ class RedisService:
     async def _connect_fake_redis(self):
         """Connect to FakeRedis for local development."""
         try:
-            self.redis_client = fakeredis.aioredis.FakeRedis(
-                decode_responses=True
-            )
+            self.redis_client = fakeredis.aioredis.FakeRedis()
             self.is_fake_redis = True
 
             # Test FakeRedis connection
@@ -61,16 +67,20 @@ class RedisService:
     async def _connect_docker_redis(self):
         """Connect to Redis container in Docker environment."""
         try:
-            self.redis_client = redis.Redis(
+            connection_class = redis.SSLConnection \
+                if settings.redis_config.tls == "true" else redis.Connection
+            self.connection_pool = redis.ConnectionPool(
+                connection_class=connection_class,
                 host=settings.redis_config.host,
                 port=settings.redis_config.port,
                 db=0,
                 password=settings.redis_config.password,
-                ssl=settings.redis_config.tls == "true",
-                decode_responses=True,
+                max_connections=REDIS_MAX_CONNECTIONS,
                 socket_connect_timeout=5,  # Docker might be slower
                 socket_timeout=5
             )
+            self.redis_client = redis.Redis(
+                connection_pool=self.connection_pool)
 
             # Test the connection
             await asyncio.wait_for(self.redis_client.ping(), timeout=5.0)
@@ -90,7 +100,14 @@ class RedisService:
                 raise ValueError(
                     "REDIS_URL is required for production environment")
 
-            self.redis_client = redis.from_url(settings.redis_config.url)
+            self.connection_pool = redis.ConnectionPool.from_url(
+                settings.redis_config.url,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                socket_connect_timeout=1,
+                socket_timeout=2
+            )
+            self.redis_client = redis.Redis(
+                connection_pool=self.connection_pool)
 
             # Test the connection
             await asyncio.wait_for(self.redis_client.ping(), timeout=10.0)
@@ -106,6 +123,9 @@ class RedisService:
         """Disconnect from Redis."""
         if self.redis_client:
             await self.redis_client.close()
+            if self.connection_pool:
+                await self.connection_pool.disconnect()
+                self.connection_pool = None
             if self.is_fake_redis:
                 print("🧪 FakeRedis connection closed")
             else:
@@ -225,11 +245,49 @@ class RedisService:
         assert self.redis_client is not None
         try:
             cached_data = await self.redis_client.get(key)
-            return json.loads(cached_data) if cached_data else None
+            return orjson.loads(cached_data) if cached_data else None
+        except Exception as e:
+            logger.error("Failed to get cached data for key %s: %s", key, e)
+            return None
+
+    async def get_cached_data_bytes(self, key: str) -> Optional[bytes]:
+        """Get a raw binary payload from Redis cache, without JSON decoding."""
+        if not self.redis_client:
+            await self.connect()
+
+        assert self.redis_client is not None
+        try:
+            return await self.redis_client.get(key)
         except Exception as e:
             logger.error("Failed to get cached data for key %s: %s", key, e)
             return None
 
+    async def set_cached_data_bytes(self, key: str, raw_bytes: bytes, expiry: int = 300):
+        """Set a raw binary payload in Redis cache, without JSON encoding."""
+        if not self.redis_client:
+            await self.connect()
+
+        assert self.redis_client is not None
+        try:
+            await self.redis_client.set(key, raw_bytes, ex=expiry)
+        except Exception as e:
+            logger.error("Failed to cache data for key %s: %s", key, e)
+
+    async def mget_cached_data(self, keys: List[str]) -> List[Any]:
+        """Get several keys from Redis cache in a single round-trip."""
+        if not self.redis_client:
+            await self.connect()
+
+        assert self.redis_client is not None
+        if not keys:
+            return []
+        try:
+            values = await self.redis_client.mget(keys)
+            return [orjson.loads(value) if value else None for value in values]
+        except Exception as e:
+            logger.error("Failed to get cached data for keys %s: %s", keys, e)
+            return [None] * len(keys)
+
     async def set_cached_data(self, key: str, data: Any, expiry: int = 300):
         """Set data in Redis cache."""
         if not self.redis_client:
@@ -237,7 +295,8 @@ class RedisService:
 
         assert self.redis_client is not None
         try:
-            await self.redis_client.setex(key, expiry, json.dumps(data))
+            await self.redis_client.setex(
+                key, expiry, orjson.dumps(data, option=ORJSON_OPTIONS))
         except Exception as e:
             logger.error("Failed to cache data for key %s: %s", key, e)
 
@@ -13,7 +13,7 @@ from app.models.yfinance_models import TickerSearchReference
 from app.models.response_models import EnhancedAssetPosition, EnhancedPortfolioResponse, \
     PortfolioMarketData
 from app.redis_service import redis_service
-from app.yfinance_service import yfinance_service
+from app.yfinance_service import validate_ticker_format, yfinance_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -21,18 +21,7 @@ logger = logging.getLogger(__name__)
 
 def validate_ticker(ticker):
     """ Validate a ticker symbol. """
-    if not ticker:
-        raise HTTPException(
-            status_code=400, detail="Ticker symbol is required")
-
-    if len(ticker) > 10:
-        raise HTTPException(
-            status_code=400, detail="Ticker symbol is too long (max 10 characters)")
-
-    if not all(c.isalnum() or c == '.' or c == '^' for c in ticker):
-        raise HTTPException(
-            status_code=400, detail="Invalid ticker symbol format (only alphanumeric, " +
-            "dots and carets allowed)")
+    validate_ticker_format(ticker)
 
 
 @router.get("/portfolio", response_model=List[AssetPosition])
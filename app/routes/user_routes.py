@@ -1,8 +1,10 @@
 """ User routes for the application. """
 from dataclasses import dataclass
 import re
+import string
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import exists, insert
 from sqlmodel import Session, select
 from app.db import get_session
 
@@ -11,6 +13,11 @@ from app.auth import create_access_token, get_current_user, hash_password, verif
 
 router = APIRouter()
 
+# Deletes every ASCII character that is not a lowercase letter or digit
+_USERNAME_DROP = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if c not in string.ascii_lowercase + string.digits))
+_NON_ALNUM = re.compile(r'[^a-z0-9]')
+
 
 @dataclass
 class AuthResponse:
@@ -30,8 +37,11 @@ class AuthResponse:
 
 def normalize_username(username: str) -> str:
     """Normalize username: lowercase, remove spaces, only alphanumeric, max 15 chars."""
-    username = username.lower().replace(' ', '')
-    username = re.sub(r'[^a-z0-9]', '', username)
+    username = username.lower()
+    if username.isascii():
+        username = username.translate(_USERNAME_DROP)
+    else:
+        username = _NON_ALNUM.sub('', username)
     return username[:15]
 
 
@@ -54,8 +64,8 @@ def register(form: OAuth2PasswordRequestForm = Depends(), session: Session = Dep
 
     # Check if username already exists
     try:
-        existing_user = session.exec(select(User).where(
-            User.username == norm_username)).first()
+        username_taken = session.exec(select(exists().where(
+            User.username == norm_username))).one()
     except Exception:
         return AuthResponse(
             success=False,
@@ -63,7 +73,7 @@ def register(form: OAuth2PasswordRequestForm = Depends(), session: Session = Dep
             access_token=None
         ).to_dict()
 
-    if existing_user:
+    if username_taken:
         return AuthResponse(
             success=False,
             message="Username already exists",
@@ -72,11 +82,11 @@ def register(form: OAuth2PasswordRequestForm = Depends(), session: Session = Dep
 
     # Create new user
     try:
-        new_user = User(username=norm_username,
-                        hashed_password=hash_password(form.password))
-        session.add(new_user)
+        # Single INSERT round-trip; the token only needs the username
+        session.exec(insert(User).values(
+            username=norm_username,
+            hashed_password=hash_password(form.password)))
         session.commit()
-        session.refresh(new_user)
         return AuthResponse(
             success=True,
             message="User registered successfully",
@@ -134,8 +144,8 @@ def list_users(
             status_code=403, detail="Insufficient permissions to access user list")
 
     try:
-        users = session.exec(select(User)).all()
-        return [{"id": user.id, "username": user.username} for user in users]
+        users = session.exec(select(User.id, User.username)).all()
+        return [{"id": user_id, "username": username} for user_id, username in users]
     except Exception as e:
         raise HTTPException(
             status_code=500, detail="Something went wrong while fetching users") from e
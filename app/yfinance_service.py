@@ -3,16 +3,75 @@ YFinance service module - centralized yfinance interactions.
 Provides clean interfaces for ticker data, validation, search, and bulk operations.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional,  Any
+import re
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, Optional, Any
 import yfinance as yf
 import pandas as pd
+import pyarrow as pa
+from cachetools import TTLCache
 from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
 
 from app.redis_service import redis_service
 
 logger = logging.getLogger(__name__)
 
+# Process-local cache sitting in front of Redis for small, hot lookups
+L1_MAXSIZE = 4096
+L1_TTL = 60  # seconds, never longer than the Redis expiry of the same entry
+
+# Valid ticker symbol: 1-10 alphanumerics, dots or carets
+TICKER_RE = re.compile(r'[A-Za-z0-9.^]{1,10}')
+
+# Bulky ticker info fields that are never cached
+TICKER_INFO_DROP_KEYS = frozenset({
+    'companyOfficers', 'fullTimeEmployees', 'longBusinessSummary', 'corporateActions'
+})
+# Lists/dicts with more entries than this are dropped from ticker info
+TICKER_INFO_MAX_CONTAINER_LEN = 50
+
+# Marker stored instead of an Arrow payload when a historical fetch failed
+HISTORICAL_ERROR_SENTINEL = b"ERROR"
+
+
+def validate_ticker_format(ticker: str) -> None:
+    """
+    Check a ticker symbol's format without touching Redis or yfinance.
+
+    Raises:
+        HTTPException: If the symbol is empty, too long or has invalid characters
+    """
+    if TICKER_RE.fullmatch(ticker):
+        return
+
+    if not ticker:
+        raise HTTPException(
+            status_code=400, detail="Ticker symbol is required")
+
+    if len(ticker) > 10:
+        raise HTTPException(
+            status_code=400,
+            detail="Ticker symbol is too long (max 10 characters)"
+        )
+
+    raise HTTPException(
+        status_code=400,
+        detail="Invalid ticker symbol format (only alphanumeric, dots and carets allowed)"
+    )
+
+
+@lru_cache(maxsize=512)
+def _ticker(symbol: str) -> yf.Ticker:
+    """
+    Shared yf.Ticker instance for history lookups, keeping its resolved
+    timezone/metadata between calls. Not used for .info, which yfinance
+    memoizes per instance and would never refresh.
+    """
+    return yf.Ticker(symbol)
+
 
 class YFinanceService:
     """Service class for all yfinance operations."""
@@ -24,6 +83,42 @@ class YFinanceService:
             'search': 1800,          # 30 minutes
             'validation': 3600,      # 1 hour
         }
+        # In-memory tier in front of Redis, keyed by the same cache keys
+        self._l1_info: TTLCache = TTLCache(maxsize=L1_MAXSIZE, ttl=L1_TTL)
+        self._l1_validation: TTLCache = TTLCache(maxsize=L1_MAXSIZE, ttl=L1_TTL)
+        self._l1_search: TTLCache = TTLCache(maxsize=L1_MAXSIZE, ttl=L1_TTL)
+        # Upstream fetches currently running, keyed by cache key
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def _coalesce(self, key: str, load: Callable[[], Awaitable[Any]]) -> Awaitable[Any]:
+        """
+        Share one upstream load between concurrent callers asking for the same key.
+
+        The load runs as a detached task that fetches from yfinance and writes
+        the cache itself, so it completes (and caches) even if the caller that
+        started it is cancelled. Callers await it through asyncio.shield().
+
+        Args:
+            key: Cache key identifying the upstream request
+            load: Coroutine function fetching and caching the data
+
+        Returns:
+            Awaitable resolving to the value returned by load
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(load())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._load_done(key, done))
+        return asyncio.shield(task)
+
+    def _load_done(self, key: str, task: asyncio.Task):
+        """Forget a finished shared load."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark a failure as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
 
     async def validate_ticker(self, ticker: str) -> bool:
         """
@@ -38,54 +133,45 @@ class YFinanceService:
         Raises:
             HTTPException: If ticker is invalid
         """
-        if not ticker:
-            raise HTTPException(
-                status_code=400, detail="Ticker symbol is required")
-
-        if len(ticker) > 10:
-            raise HTTPException(
-                status_code=400,
-                detail="Ticker symbol is too long (max 10 characters)"
-            )
-
-        if not all(c.isalnum() or c == '.' or c == '^' for c in ticker):
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid ticker symbol format (only alphanumeric, dots and carets allowed)"
-            )
+        validate_ticker_format(ticker)
 
         # Check cache first
         cache_key = f"ticker_validation:{ticker.upper()}"
-        cached_result = await redis_service.get_cached_data(cache_key)
+        is_valid = self._l1_validation.get(cache_key)
+        if is_valid is None:
+            is_valid = await redis_service.get_cached_data(cache_key)
+            if is_valid is not None:
+                self._l1_validation[cache_key] = is_valid
 
-        if cached_result is not None:
-            if not cached_result:
-                raise HTTPException(
-                    status_code=404, detail="Ticker not found or invalid.")
-            return True
+        if is_valid is None:
+            is_valid = await self._coalesce(
+                cache_key, lambda: self._load_validation(ticker, cache_key))
 
-        # Validate with yfinance
+        if not is_valid:
+            raise HTTPException(
+                status_code=404, detail="Ticker not found or invalid.")
+        return True
+
+    async def _load_validation(self, ticker: str, cache_key: str) -> bool:
+        """Validate a ticker with yfinance and cache the outcome."""
+        # Blocking HTTP call, keep it off the event loop
         try:
-            info = yf.Ticker(ticker).info
+            info = await run_in_threadpool(lambda: yf.Ticker(ticker).info)
             is_valid = bool(info and info.get(
                 'regularMarketPrice') is not None)
+        except Exception as e:
+            logger.error("Error validating ticker %s: %s", ticker, e)
+            is_valid = False
 
-            # Cache the result
+        self._l1_validation[cache_key] = is_valid
+        if is_valid:
             await redis_service.set_cached_data(
-                cache_key, is_valid, expiry=self.cache_duration['validation']
+                cache_key, True, expiry=self.cache_duration['validation']
             )
-
-            if not is_valid:
-                raise HTTPException(
-                    status_code=404, detail="Ticker not found or invalid.")
-
-            return True
-
-        except Exception as e:
+        else:
             # Cache negative result for shorter time
             await redis_service.set_cached_data(cache_key, False, expiry=60)
-            raise HTTPException(
-                status_code=404, detail="Ticker not found or invalid.") from e
+        return is_valid
 
     async def get_ticker_info(self, ticker: str) -> Dict[str, Any]:
         """
@@ -101,32 +187,18 @@ class YFinanceService:
             HTTPException: If ticker data cannot be retrieved
         """
         cache_key = f"ticker_info:{ticker.upper()}"
-        cached_data = await redis_service.get_cached_data(cache_key)
+        cached_data = self._l1_info.get(cache_key)
+        if cached_data:
+            return cached_data
 
+        cached_data = await redis_service.get_cached_data(cache_key)
         if cached_data:
+            self._l1_info[cache_key] = cached_data
             return cached_data
 
         try:
-            info = yf.Ticker(ticker).info
-
-            if not info:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"No information available for ticker: {ticker}"
-                )
-
-            # Clean info data (remove large unnecessary fields)
-            cleaned_info = {k: v for k, v in info.items() if k not in [
-                'companyOfficers', 'fullTimeEmployees', 'longBusinessSummary'
-            ] and not (isinstance(v, (list, dict)) and len(str(v)) > 1000)}
-
-            # Cache the result
-            await redis_service.set_cached_data(
-                cache_key, cleaned_info, expiry=self.cache_duration['ticker_info']
-            )
-
-            return cleaned_info
-
+            return await self._coalesce(
+                cache_key, lambda: self._load_ticker_info(ticker, cache_key))
         except Exception as e:
             logger.error("Error fetching ticker info for %s: %s", ticker, e)
             raise HTTPException(
@@ -134,6 +206,29 @@ class YFinanceService:
                 detail=f"Unable to retrieve data for ticker: {ticker}"
             ) from e
 
+    async def _load_ticker_info(self, ticker: str, cache_key: str) -> Dict[str, Any]:
+        """Fetch and clean ticker information from yfinance, then cache it."""
+        info = await run_in_threadpool(lambda: yf.Ticker(ticker).info)
+
+        if not info:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No information available for ticker: {ticker}"
+            )
+
+        # Clean info data (remove large unnecessary fields)
+        cleaned_info = {k: v for k, v in info.items() if k not in TICKER_INFO_DROP_KEYS
+                        and not (isinstance(v, (list, dict))
+                                 and len(v) > TICKER_INFO_MAX_CONTAINER_LEN)}
+
+        # Cache the result
+        self._l1_info[cache_key] = cleaned_info
+        await redis_service.set_cached_data(
+            cache_key, cleaned_info, expiry=self.cache_duration['ticker_info']
+        )
+
+        return cleaned_info
+
     async def get_historical_data(
             self,
             ticker: str,
@@ -151,31 +246,42 @@ class YFinanceService:
             DataFrame with historical data or None if failed
         """
         cache_key = f"historical:{ticker.upper()}:{period}:{auto_adjust}"
-        cached_data = await redis_service.get_cached_data(cache_key)
+        cached_data = await redis_service.get_cached_data_bytes(cache_key)
 
         if cached_data is not None:
-            if cached_data == "ERROR":
+            if cached_data == HISTORICAL_ERROR_SENTINEL:
                 return None
-            # Convert back to DataFrame
-            return pd.DataFrame(cached_data)
+            # Convert back to DataFrame (index restored natively), refetch if unreadable
+            hist_data = self._deserialize_dataframe(cached_data)
+            if hist_data is not None:
+                return hist_data
+
+        return await self._coalesce(
+            cache_key,
+            lambda: self._load_historical_data(ticker, period, auto_adjust, cache_key))
 
+    async def _load_historical_data(
+            self,
+            ticker: str,
+            period: str,
+            auto_adjust: bool,
+            cache_key: str) -> Optional[pd.DataFrame]:
+        """Fetch historical data for a single ticker from yfinance, then cache it."""
         try:
-            ticker_obj = yf.Ticker(ticker)
-            hist_data = ticker_obj.history(
-                period=period, auto_adjust=auto_adjust)
+            ticker_obj = _ticker(ticker.upper())
+            hist_data = await run_in_threadpool(
+                ticker_obj.history, period=period, auto_adjust=auto_adjust)
 
             if hist_data.empty:
-                await redis_service.set_cached_data(cache_key, "ERROR", expiry=300)
+                await redis_service.set_cached_data_bytes(
+                    cache_key, HISTORICAL_ERROR_SENTINEL, expiry=300)
                 return None
 
-            # Cache as dict for JSON serialization
-            cache_data = {
-                'index': [d.isoformat() for d in hist_data.index],
-                'data': hist_data.to_dict('list')
-            }
-
-            await redis_service.set_cached_data(
-                cache_key, cache_data, expiry=self.cache_duration['historical']
+            # Cache the data as an Arrow IPC payload
+            await redis_service.set_cached_data_bytes(
+                cache_key,
+                self._serialize_dataframe(hist_data),
+                expiry=self.cache_duration['historical']
             )
 
             return hist_data
@@ -183,7 +289,8 @@ class YFinanceService:
         except Exception as e:
             logger.error(
                 "Error fetching historical data for %s: %s", ticker, e)
-            await redis_service.set_cached_data(cache_key, "ERROR", expiry=300)
+            await redis_service.set_cached_data_bytes(
+                cache_key, HISTORICAL_ERROR_SENTINEL, expiry=300)
             return None
 
     async def get_bulk_historical_data(
@@ -201,38 +308,47 @@ class YFinanceService:
             Multi-level DataFrame with historical data for all tickers
         """
         cache_key = f"bulk_historical:{':'.join(sorted(tickers))}:{period}"
-        cached_data = await redis_service.get_cached_data(cache_key)
+        cached_data = await redis_service.get_cached_data_bytes(cache_key)
 
         if cached_data is not None:
-            if cached_data == "ERROR":
+            if cached_data == HISTORICAL_ERROR_SENTINEL:
                 return pd.DataFrame()
-            # Reconstruct DataFrame from cached data
-            return self._reconstruct_bulk_dataframe(cached_data)
+            # Reconstruct DataFrame from cached data, refetch if unreadable
+            hist_data = self._deserialize_dataframe(cached_data)
+            if hist_data is not None:
+                return hist_data
+
+        return await self._coalesce(
+            cache_key, lambda: self._load_bulk_historical_data(tickers, period, cache_key))
 
+    async def _load_bulk_historical_data(
+            self,
+            tickers: List[str],
+            period: str,
+            cache_key: str) -> pd.DataFrame:
+        """Fetch historical data for multiple tickers from yfinance, then cache it."""
         try:
             tickers_obj = yf.Tickers(' '.join(tickers))
-            hist_data = tickers_obj.history(period=period)
+            hist_data = await run_in_threadpool(tickers_obj.history, period=period)
 
             if hist_data.empty:
-                await redis_service.set_cached_data(cache_key, "ERROR", expiry=300)
+                await redis_service.set_cached_data_bytes(
+                    cache_key, HISTORICAL_ERROR_SENTINEL, expiry=300)
                 return pd.DataFrame()
 
-            # Cache the data
-            cache_data = {
-                'index': [d.isoformat() for d in hist_data.index],
-                'columns': [list(col) for col in hist_data.columns],
-                'data': hist_data.values.tolist()
-            }
-
-            await redis_service.set_cached_data(
-                cache_key, cache_data, expiry=self.cache_duration['historical']
+            # Cache the data as an Arrow IPC payload
+            await redis_service.set_cached_data_bytes(
+                cache_key,
+                self._serialize_dataframe(hist_data),
+                expiry=self.cache_duration['historical']
             )
 
             return hist_data
 
         except Exception as e:
             logger.error("Error fetching bulk historical data: %s", e)
-            await redis_service.set_cached_data(cache_key, "ERROR", expiry=300)
+            await redis_service.set_cached_data_bytes(
+                cache_key, HISTORICAL_ERROR_SENTINEL, expiry=300)
             return pd.DataFrame()
 
     # CHECKED OK
@@ -248,25 +364,18 @@ class YFinanceService:
             List of ticker search results
         """
         cache_key = f"ticker_search:{query.lower()}"
-        cached_data = await redis_service.get_cached_data(cache_key)
+        cached_data = self._l1_search.get(cache_key)
+        if cached_data:
+            return cached_data[:limit]
 
+        cached_data = await redis_service.get_cached_data(cache_key)
         if cached_data:
+            self._l1_search[cache_key] = cached_data
             return cached_data[:limit]
 
         try:
-            data = yf.Search(query).quotes
-            results = []
-
-            for item in data:
-                if not item.get("symbol"):
-                    logger.warning("Invalid ticker search result: %s", item)
-                    continue
-                results.append(item)
-
-            await redis_service.set_cached_data(
-                cache_key, results, expiry=self.cache_duration['search']
-            )
-
+            results = await self._coalesce(
+                cache_key, lambda: self._load_search(query, cache_key))
             return results[:limit]
 
         except Exception as e:
@@ -277,6 +386,24 @@ class YFinanceService:
                 detail="yfinance failed to search for tickers"
             ) from e
 
+    async def _load_search(self, query: str, cache_key: str) -> List[Dict[str, Any]]:
+        """Search tickers with yfinance, then cache the results."""
+        data = await run_in_threadpool(lambda: yf.Search(query).quotes)
+        results = []
+
+        for item in data:
+            if not item.get("symbol"):
+                logger.warning("Invalid ticker search result: %s", item)
+                continue
+            results.append(item)
+
+        self._l1_search[cache_key] = results
+        await redis_service.set_cached_data(
+            cache_key, results, expiry=self.cache_duration['search']
+        )
+
+        return results
+
     async def get_current_price(self, ticker: str) -> Optional[float]:
         """
         Get current price for a ticker.
@@ -304,34 +431,59 @@ class YFinanceService:
         Returns:
             Dict mapping ticker to current price
         """
-        prices = {}
+        prices: Dict[str, Optional[float]] = {}
+        missing: List[str] = []
+        redis_keys: Dict[str, str] = {}
 
-        # Try to get from individual ticker info (cached)
+        # Serve what we can from the in-memory tier
         for ticker in tickers:
-            try:
-                price = await self.get_current_price(ticker)
-                prices[ticker] = price
-            except Exception as e:
-                logger.error("Error getting price for %s: %s", ticker, e)
+            cache_key = f"ticker_info:{ticker.upper()}"
+            info = self._l1_info.get(cache_key)
+            if info:
+                prices[ticker] = info.get('regularMarketPrice') or info.get('currentPrice')
+            else:
+                redis_keys[ticker] = cache_key
+
+        # One MGET for everything else
+        cached = await redis_service.mget_cached_data(list(redis_keys.values()))
+        for (ticker, cache_key), info in zip(redis_keys.items(), cached):
+            if info:
+                self._l1_info[cache_key] = info
+                prices[ticker] = info.get('regularMarketPrice') or info.get('currentPrice')
+            else:
+                missing.append(ticker)
+
+        # Fetch the remaining tickers concurrently; each load caches its own result
+        results = await asyncio.gather(
+            *[self._coalesce(redis_keys[ticker],
+                             lambda t=ticker: self._load_ticker_info(t, redis_keys[t]))
+              for ticker in missing],
+            return_exceptions=True
+        )
+        for ticker, info in zip(missing, results):
+            if isinstance(info, BaseException):
+                logger.error("Error getting price for %s: %s", ticker, info)
                 prices[ticker] = None
+                continue
+            prices[ticker] = info.get('regularMarketPrice') or info.get('currentPrice')
 
-        return prices
+        return {ticker: prices.get(ticker) for ticker in tickers}
 
-    def _reconstruct_bulk_dataframe(self, cached_data: Dict) -> pd.DataFrame:
-        """Reconstruct DataFrame from cached bulk historical data."""
+    def _serialize_dataframe(self, hist_data: pd.DataFrame) -> bytes:
+        """Serialize historical data to Arrow IPC bytes for caching."""
+        table = pa.Table.from_pandas(hist_data)
+        buf = pa.BufferOutputStream()
+        with pa.ipc.new_file(buf, table.schema) as writer:
+            writer.write_table(table)
+        return buf.getvalue().to_pybytes()
+
+    def _deserialize_dataframe(self, cached_data: bytes) -> Optional[pd.DataFrame]:
+        """Reconstruct DataFrame from cached historical data."""
         try:
-            index = pd.to_datetime(cached_data['index'])
-            columns = pd.MultiIndex.from_tuples(
-                [tuple(col) for col in cached_data['columns']]
-            )
-            return pd.DataFrame(
-                cached_data['data'],
-                index=index,
-                columns=columns
-            )
+            return pa.ipc.open_file(pa.BufferReader(cached_data)).read_all().to_pandas()
         except Exception as e:
             logger.error("Error reconstructing DataFrame from cache: %s", e)
-            return pd.DataFrame()
+            return None
 
 
 # Global service instance